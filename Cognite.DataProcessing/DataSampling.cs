@@ -34,10 +34,7 @@ namespace Cognite.DataProcessing
             {
                 // the input time series contain values of 1 and 0. The resulting time series will only be 1 if both
                 // input time series have a value of 1.
-                if (y1[i] == 1.0 && y2[i] == 1.0)
-                    y3[i] = 1.0;
-                else
-                    y3[i] = 0.0;
+                y3[i] = (y1[i] == 1.0 && y2[i] == 1.0) ? 1.0 : 0.0;
             }
             return new TimeSeriesData(time: x, data: y3, granularity: ts1Resampled.Granularity, isStep: true);
         }
@@ -122,32 +119,36 @@ namespace Cognite.DataProcessing
             // create an array to store the binary values
             double[] yRes = new double[y.Length];
 
-            // run the logical check for each timestamp
-            for (int i = 0; i < x.Length; i++)
+            // run the logical check for each timestamp. The operator is resolved once, outside of the loops, so
+            // that each loop body is a single comparison without any branching on the operator
+            switch (check)
             {
-                switch (check)
-                {
-                    case LogicOperator.Eq:
+                case LogicOperator.Eq:
+                    for (int i = 0; i < x.Length; i++)
                         yRes[i] = (y[i] == threshold) ? 1.0 : 0.0;
-                        break;
-                    case LogicOperator.Ne:
+                    break;
+                case LogicOperator.Ne:
+                    for (int i = 0; i < x.Length; i++)
                         yRes[i] = (y[i] != threshold) ? 1.0 : 0.0;
-                        break;
-                    case LogicOperator.Gt:
+                    break;
+                case LogicOperator.Gt:
+                    for (int i = 0; i < x.Length; i++)
                         yRes[i] = (y[i] > threshold) ? 1.0 : 0.0;
-                        break;
-                    case LogicOperator.Ge:
+                    break;
+                case LogicOperator.Ge:
+                    for (int i = 0; i < x.Length; i++)
                         yRes[i] = (y[i] >= threshold) ? 1.0 : 0.0;
-                        break;
-                    case LogicOperator.Lt:
+                    break;
+                case LogicOperator.Lt:
+                    for (int i = 0; i < x.Length; i++)
                         yRes[i] = (y[i] < threshold) ? 1.0 : 0.0;
-                        break;
-                    case LogicOperator.Le:
+                    break;
+                case LogicOperator.Le:
+                    for (int i = 0; i < x.Length; i++)
                         yRes[i] = (y[i] <= threshold) ? 1.0 : 0.0;
-                        break;
-                    default:
-                        throw new ArgumentException($"Unknown operator {check}", nameof(check));
-                }
+                    break;
+                default:
+                    throw new ArgumentException($"Unknown operator {check}", nameof(check));
             }
 
             return new TimeSeriesData(time: x, data: yRes, granularity: ts.Granularity, isStep: ts.IsStep);
@@ -57,10 +57,14 @@ namespace Cognite.DataProcessing
             // We should precalculate sums for empirical CDF, it will allow fast evaluating of the segment cost
             int[,] partialSums = GetPartialSums(data, k);
 
-            // Since we use the same values of `partialSums`, `k`, `n` all the time,
+            // The segment cost is scaled by `2 * c / k`, where `c = -log(2n - 1)` is the constant from Lemma 3.1 in
+            // [Haynes2017]. It only depends on `n` and `k`, so we compute it once instead of on every cost evaluation
+            double costFactor = 2.0 * -Math.Log(2 * n - 1) / k;
+
+            // Since we use the same values of `partialSums`, `k`, `costFactor` all the time,
             // we introduce a shortcut `Cost(tau1, tau2)` for segment cost evaluation.
             // Hereinafter, we use `tau` to name variables that are change point candidates.
-            double Cost(int tau1, int tau2) => GetSegmentCost(partialSums, tau1, tau2, k, n);
+            double Cost(int tau1, int tau2) => GetSegmentCost(partialSums, tau1, tau2, k, costFactor);
 
             // We will use dynamic programming to find the best solution; `bestCost` is the cost array.
             // `bestCost[i]` is the cost for subarray `data[0..i-1]`.
@@ -176,8 +180,9 @@ namespace Cognite.DataProcessing
         /// <summary>
         /// Calculates the cost of the (tau1; tau2] segment.
         /// </summary>
-        private static double GetSegmentCost(int[,] partialSums, int tau1, int tau2, int k, int n)
+        private static double GetSegmentCost(int[,] partialSums, int tau1, int tau2, int k, double costFactor)
         {
+            int segmentLength = tau2 - tau1;
             double sum = 0;
             for (int i = 0; i < k; i++)
             {
@@ -185,17 +190,16 @@ namespace Cognite.DataProcessing
                 int actualSum = partialSums[i, tau2] - partialSums[i, tau1];
 
                 // We skip these two cases (correspond to fit = 0 or fit = 1) because of invalid Math.Log values
-                if (actualSum != 0 && actualSum != (tau2 - tau1) * 2)
+                if (actualSum != 0 && actualSum != segmentLength * 2)
                 {
                     // Empirical CDF $\hat{F}_i(t)$ (Section 2.1 "Model" in [Haynes2017])
-                    double fit = actualSum * 0.5 / (tau2 - tau1);
+                    double fit = actualSum * 0.5 / segmentLength;
                     // Segment cost $\mathcal{L}_{np}$ (Section 2.2 "Nonparametric maximum likelihood" in [Haynes2017])
-                    double lnp = (tau2 - tau1) * (fit * Math.Log(fit) + (1 - fit) * Math.Log(1 - fit));
+                    double lnp = segmentLength * (fit * Math.Log(fit) + (1 - fit) * Math.Log(1 - fit));
                     sum += lnp;
                 }
             }
-            double c = -Math.Log(2 * n - 1); // Constant from Lemma 3.1 in [Haynes2017]
-            return 2.0 * c / k * sum; // See Section 3.1 "Discrete approximation" in [Haynes2017]
+            return costFactor * sum; // See Section 3.1 "Discrete approximation" in [Haynes2017]
         }
 
         /// <summary>
@@ -279,15 +283,20 @@ namespace Cognite.DataProcessing
             // this will prevent generating infinite values on the var calculation below
             double divisor = TimeSeriesUtils.Constrain(value: avg, min: 1.0e-4, max: 1.0e6);
 
+            // the line fit needs the timestamps as doubles. Convert them once for the whole series instead of once
+            // per segment
+            double[] xd = Array.ConvertAll<long, double>(x, item => item);
+
+            // the slope limit does not depend on the segment
+            double maxSlope = Math.Pow(10.0, slopeThreshold);
+
             for (int i = 1; i < changePoints.Length; i++)
             {
                 int i0 = changePoints[i - 1];
                 int i1 = changePoints[i];
-                long[] xi = x.Skip(i0).Take(i1 - i0).ToArray(); //x[i0..i1]
-                double[] xid = Array.ConvertAll<long, double>(xi, item => item);
-                double[] yi = y.Skip(i0).Take(i1 - i0).ToArray(); //y[i0..i1]
 
-                double std = yi.StandardDeviation() / (i1 - i0);
+                // the standard deviation is evaluated directly on the segment of the input array, without copying it
+                double std = new ArraySegment<double>(y, i0, i1 - i0).StandardDeviation() / (i1 - i0);
                 double stdNormalised = 1.0e5 * std / divisor;
 
                 // We consider a region as transient unless it passed the subsequent logical tests
@@ -296,10 +305,12 @@ namespace Cognite.DataProcessing
                 // First check if the variance criteria is met
                 if (Math.Abs(stdNormalised) < varThreshold)
                 {
-                    // Only fit a line if the first criteria is met
+                    // Only copy the segment and fit a line if the first criteria is met
+                    double[] xid = TimeSeriesUtils.SubArray(xd, i0, i1 - i0); //xd[i0..i1]
+                    double[] yi = TimeSeriesUtils.SubArray(y, i0, i1 - i0); //y[i0..i1]
                     (double _, double slope) = Fit.Line(xid, yi);
 
-                    if (Math.Abs(slope) < Math.Pow(10.0, slopeThreshold))
+                    if (Math.Abs(slope) < maxSlope)
                     {
                         ssRegion = 1.0;
                     }
@@ -7,6 +7,10 @@ namespace Cognite.DataProcessing
     /// </summary>
     public static class Optimizers
     {
+        // Constants used by the bounded scalar minimization, computed once
+        private static readonly double _sqrtEps = Math.Sqrt(2.2e-16);
+        private static readonly double _goldenMean = 0.5 * (3.0 - Math.Sqrt(5.0));
+
         /// <summary>
         /// Represents the optimization result.
         /// </summary>
@@ -82,10 +86,8 @@ namespace Cognite.DataProcessing
 
             int flag = 0;
 
-            double sqrtEps = Math.Sqrt(2.2e-16);
-            double goldenMean = 0.5 * (3.0 - Math.Sqrt(5.0));
             var (a, b) = (lowerBound, upperBound);
-            double fulc = a + goldenMean * (b - a);
+            double fulc = a + _goldenMean * (b - a);
             var (nfc, xf) = (fulc, fulc);
             var (rat, e) = (0.0, 0.0);
             double x = xf;
@@ -95,7 +97,7 @@ namespace Cognite.DataProcessing
 
             (double ffulc, double fnfc) = (fx, fx);
             double xm = 0.5 * (a + b);
-            double tol1 = sqrtEps * Math.Abs(xf) + accuracy / 3.0;
+            double tol1 = _sqrtEps * Math.Abs(xf) + accuracy / 3.0;
             double tol2 = 2.0 * tol1;
 
             while (Math.Abs(xf - xm) > (tol2 - 0.5 * (b - a)))
@@ -139,7 +141,7 @@ namespace Cognite.DataProcessing
                         e = a - xf;
                     else
                         e = b - xf;
-                    rat = goldenMean * e;
+                    rat = _goldenMean * e;
                 }
 
                 ez = (rat == 0) ? 1 : 0;
@@ -175,7 +177,7 @@ namespace Cognite.DataProcessing
                     }
                 }
                 xm = 0.5 * (a + b);
-                tol1 = sqrtEps * Math.Abs(xf) + accuracy / 3.0;
+                tol1 = _sqrtEps * Math.Abs(xf) + accuracy / 3.0;
                 tol2 = 2.0 * tol1;
 
                 if (num >= maxIterations)
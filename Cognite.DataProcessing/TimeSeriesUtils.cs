@@ -65,8 +65,8 @@ namespace Cognite.DataProcessing
             MinTime = Time[0];
             MaxTime = Time[Time.Length - 1];
 
+            // Removing duplicates keeps the timestamps in order, so there is no need to sort again
             RemoveDuplicates();
-            Array.Sort(Time, Data);
             Count = Data.Length;
 
             // Evaluate if there are gaps in the data
@@ -74,16 +74,17 @@ namespace Cognite.DataProcessing
         }
 
         /// <summary>
-        /// Removes duplicate timestamps from the time series.
+        /// Removes duplicate timestamps from the time series. Expects the time series to be sorted by timestamp,
+        /// so that duplicates are adjacent and only the previous timestamp needs to be checked.
         /// </summary>
         private void RemoveDuplicates()
         {
-            List<long> timeUnique = new List<long>();
-            List<double> dataUnique = new List<double>();
+            List<long> timeUnique = new List<long>(Time.Length);
+            List<double> dataUnique = new List<double>(Data.Length);
 
             for (int i = 0; i < Time.Length; i++)
             {
-                if (!timeUnique.Contains(Time[i]))
+                if (i == 0 || Time[i] != Time[i - 1])
                 {
                     timeUnique.Add(Time[i]);
                     dataUnique.Add(Data[i]);
@@ -204,8 +205,8 @@ namespace Cognite.DataProcessing
 
             i1++; // include the endTime
             return new TimeSeriesData(
-                Time.Skip(i0).Take(i1 - i0).ToArray(), //Time[i0..i1],
-                Data.Skip(i0).Take(i1 - i0).ToArray(), //Data[i0..i1],
+                TimeSeriesUtils.SubArray(Time, i0, i1 - i0), //Time[i0..i1],
+                TimeSeriesUtils.SubArray(Data, i0, i1 - i0), //Data[i0..i1],
                 Granularity, IsStep);
         }
 
@@ -231,9 +232,9 @@ namespace Cognite.DataProcessing
         /// </summary>
         internal static double ExecuteLinearInterpolation(long x0, double y0, long x1, double y1, long xp)
         {
-            double x0d = Convert.ToDouble(x0);
-            double x1d = Convert.ToDouble(x1);
-            double xpd = Convert.ToDouble(xp);
+            double x0d = x0;
+            double x1d = x1;
+            double xpd = xp;
 
             return y0 + (y1 - y0) / (x1d - x0d) * (xpd - x0d);
         }
@@ -253,6 +254,21 @@ namespace Cognite.DataProcessing
             return result;
         }
 
+        /// <summary>
+        /// Copies <paramref name="length"/> elements of the array, starting at <paramref name="start"/>,
+        /// into a new array. A non-positive length results in an empty array.
+        /// </summary>
+        internal static T[] SubArray<T>(T[] array, int start, int length)
+        {
+            if (length <= 0)
+                return Array.Empty<T>();
+
+            T[] result = new T[length];
+            Array.Copy(array, start, result, 0, length);
+
+            return result;
+        }
+
         /// <summary>
         /// Aligns two time series according to their timestamps.
         /// </summary>
@@ -3,8 +3,8 @@ using CogniteSdk.Resources;
 using Com.Cognite.V1.Timeseries.Proto;
 using System;
 using System.Collections.Generic;
+using System.Globalization;
 using System.Linq;
-using System.Text;
 using System.Threading;
 using System.Threading.Tasks;
 
@@ -41,23 +41,27 @@ namespace Cognite.Simulator.Extensions
             {
                 throw new ArgumentNullException(nameof(timeRange));
             }
+            // Format the range boundaries directly, and only once, instead of boxing them into string interpolation
+            var start = timeRange.Start.Value.ToString(CultureInfo.InvariantCulture);
+            var end = (timeRange.End.Value + 1).ToString(CultureInfo.InvariantCulture); // Add 1 because end is exclusive
             var dps = await dataPoints.ListAsync(
                 new DataPointsQuery
                 {
                     Items = new[] { new DataPointsQueryItem {
                         ExternalId = timeSeriesExternalId,
                         Aggregates = new[] { aggregate.AsString() },
-                        Start = $"{timeRange.Start.Value}",
-                        End = $"{timeRange.End.Value + 1}", // Add 1 because end is exclusive
+                        Start = start,
+                        End = end,
                         Granularity = MinutesToGranularity(granularity),
                         Limit = 10_000 // TODO: Functionality to make sure we get all data points
                     }},
                     IgnoreUnknownIds = true
                 }, token
             ).ConfigureAwait(false);
-            if (dps.Items.Any() && dps.Items.First().DatapointTypeCase == DataPointListItem.DatapointTypeOneofCase.AggregateDatapoints)
+            var dpsItem = dps.Items.FirstOrDefault();
+            if (dpsItem != null && dpsItem.DatapointTypeCase == DataPointListItem.DatapointTypeOneofCase.AggregateDatapoints)
             {
-                return dps.Items.First().ToTimeSeriesData(aggregate);
+                return dpsItem.ToTimeSeriesData(aggregate);
             }
             else if (aggregate == DataPointAggregate.StepInterpolation)
             {
@@ -69,16 +73,17 @@ namespace Cognite.Simulator.Extensions
                         Items = new[] {
                                 new DataPointsQueryItem {
                                     ExternalId = timeSeriesExternalId,
-                                    Start = $"{timeRange.Start.Value}",
+                                    Start = start,
                                     Limit = 1
                                 }
                         },
                         IgnoreUnknownIds = true
                     }, token
                 ).ConfigureAwait(false);
-                if (firstDp.Items.Any() && firstDp.Items.First().DatapointTypeCase == DataPointListItem.DatapointTypeOneofCase.NumericDatapoints)
+                var firstDpItem = firstDp.Items.FirstOrDefault();
+                if (firstDpItem != null && firstDpItem.DatapointTypeCase == DataPointListItem.DatapointTypeOneofCase.NumericDatapoints)
                 {
-                    return firstDp.Items.First().ToTimeSeriesData(aggregate);
+                    return firstDpItem.ToTimeSeriesData(aggregate);
                 }
 
             }
@@ -89,10 +94,7 @@ namespace Cognite.Simulator.Extensions
         {
             if (aggregate == DataPointAggregate.StepInterpolation && dps.DatapointTypeCase == DataPointListItem.DatapointTypeOneofCase.NumericDatapoints)
             {
-                var numericDps = dps.NumericDatapoints.Datapoints;
-                return (
-                    numericDps.Select(ndp => ndp.Timestamp).ToArray(),
-                    numericDps.Select(ndp => ndp.Value).ToArray());
+                return dps.NumericDatapoints.Datapoints.ToArrays(ndp => ndp.Timestamp, ndp => ndp.Value);
             }
             if (dps.DatapointTypeCase != DataPointListItem.DatapointTypeOneofCase.AggregateDatapoints)
             {
@@ -102,50 +104,50 @@ namespace Cognite.Simulator.Extensions
             switch (aggregate)
             {
                 case DataPointAggregate.Average:
-                    return (
-                        values.Select(dp => dp.Timestamp).ToArray(),
-                        values.Select(dp => dp.Average).ToArray());
+                    return values.ToArrays(dp => dp.Timestamp, dp => dp.Average);
                 case DataPointAggregate.Max:
-                    return(
-                        values.Select(dp => dp.Timestamp).ToArray(),
-                        values.Select(dp => dp.Max).ToArray());
+                    return values.ToArrays(dp => dp.Timestamp, dp => dp.Max);
                 case DataPointAggregate.Min:
-                    return (
-                        values.Select(dp => dp.Timestamp).ToArray(),
-                        values.Select(dp => dp.Min).ToArray());
+                    return values.ToArrays(dp => dp.Timestamp, dp => dp.Min);
                 case DataPointAggregate.Count:
-                    return(
-                        values.Select(dp => dp.Timestamp).ToArray(),
-                        values.Select(dp => dp.Count).ToArray());
+                    return values.ToArrays(dp => dp.Timestamp, dp => dp.Count);
                 case DataPointAggregate.Sum:
-                    return (
-                        values.Select(dp => dp.Timestamp).ToArray(),
-                        values.Select(dp => dp.Sum).ToArray());
+                    return values.ToArrays(dp => dp.Timestamp, dp => dp.Sum);
                 case DataPointAggregate.Interpolation:
-                    return (
-                        values.Select(dp => dp.Timestamp).ToArray(),
-                        values.Select(dp => dp.Interpolation).ToArray());
+                    return values.ToArrays(dp => dp.Timestamp, dp => dp.Interpolation);
                 case DataPointAggregate.StepInterpolation:
-                    return (
-                        values.Select(dp => dp.Timestamp).ToArray(),
-                        values.Select(dp => dp.StepInterpolation).ToArray()); // defined as step time series
+                    return values.ToArrays(dp => dp.Timestamp, dp => dp.StepInterpolation); // defined as step time series
                 case DataPointAggregate.TotalVariation:
-                    return (
-                        values.Select(dp => dp.Timestamp).ToArray(),
-                        values.Select(dp => dp.TotalVariation).ToArray());
+                    return values.ToArrays(dp => dp.Timestamp, dp => dp.TotalVariation);
                 case DataPointAggregate.ContinuousVariance:
-                    return (
-                        values.Select(dp => dp.Timestamp).ToArray(),
-                        values.Select(dp => dp.ContinuousVariance).ToArray());
+                    return values.ToArrays(dp => dp.Timestamp, dp => dp.ContinuousVariance);
                 case DataPointAggregate.DiscreteVariance:
-                    return (
-                        values.Select(dp => dp.Timestamp).ToArray(),
-                        values.Select(dp => dp.DiscreteVariance).ToArray());
+                    return values.ToArrays(dp => dp.Timestamp, dp => dp.DiscreteVariance);
                 default:
                     throw new ArgumentException($"Invalid aggregate: {aggregate}", nameof(aggregate));
             }
         }
 
+        /// <summary>
+        /// Copy the timestamps and values of the given data points into two arrays
+        /// in a single pass over the data points
+        /// </summary>
+        private static (long[] Timestamps, double[] Values) ToArrays<T>(
+            this IList<T> dps,
+            Func<T, long> timestamp,
+            Func<T, double> value)
+        {
+            var timestamps = new long[dps.Count];
+            var values = new double[dps.Count];
+            for (int i = 0; i < dps.Count; i++)
+            {
+                var dp = dps[i];
+                timestamps[i] = timestamp(dp);
+                values[i] = value(dp);
+            }
+            return (timestamps, values);
+        }
+
         internal static string AsString(this DataPointAggregate aggregate)
         {
             switch (aggregate)
@@ -161,7 +163,7 @@ namespace Cognite.Simulator.Extensions
                 case DataPointAggregate.ContinuousVariance: return "continuousVariance";
                 case DataPointAggregate.DiscreteVariance: return "discreteVariance";
                 default:
-                    throw new ArgumentException($"Invalid aggregate type: {aggregate.AsString()}", nameof(aggregate));
+                    throw new ArgumentException($"Invalid aggregate type: {aggregate}", nameof(aggregate));
 
             }
         }
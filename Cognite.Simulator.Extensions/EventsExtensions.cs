@@ -5,7 +5,6 @@ using CogniteSdk.Resources;
 using System;
 using System.Collections.Generic;
 using System.Linq;
-using System.Text;
 using System.Threading;
 using System.Threading.Tasks;
 
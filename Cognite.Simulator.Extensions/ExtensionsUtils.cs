@@ -2,7 +2,6 @@
 using System;
 using System.Collections.Generic;
 using System.Linq;
-using System.Text;
 using System.Text.RegularExpressions;
 
 namespace Cognite.Simulator.Extensions
@@ -12,6 +11,10 @@ namespace Cognite.Simulator.Extensions
     /// </summary>
     public static class ExtensionsUtils
     {
+        // Compiled once and reused, instead of being looked up in the static regex cache on every call
+        private static readonly Regex _specialCharacters = new Regex("[^a-zA-Z0-9_.]+", RegexOptions.Compiled);
+        private static readonly Regex _slashAndBackslash = new Regex("[/\\\\]", RegexOptions.Compiled);
+
         /// <summary>
         /// Replace all occurrences of special characters
         /// </summary>
@@ -20,7 +23,7 @@ namespace Cognite.Simulator.Extensions
         /// <returns>A new string</returns>
         public static string ReplaceSpecialCharacters(this string s, string replaceWith)
         {
-            return Regex.Replace(s, "[^a-zA-Z0-9_.]+", replaceWith, RegexOptions.Compiled);
+            return _specialCharacters.Replace(s, replaceWith);
         }
 
         /// <summary>
@@ -31,7 +34,7 @@ namespace Cognite.Simulator.Extensions
         /// <returns>A new string</returns>
         public static string ReplaceSlashAndBackslash(this string s, string replaceWith)
         {
-            return Regex.Replace(s, "[/\\\\]", replaceWith, RegexOptions.Compiled);
+            return _slashAndBackslash.Replace(s, replaceWith);
         }
 
         internal static void AddRange(
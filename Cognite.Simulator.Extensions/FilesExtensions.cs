@@ -3,6 +3,7 @@ using CogniteSdk;
 using CogniteSdk.Resources;
 using System;
 using System.Collections.Generic;
+using System.Linq;
 using System.Threading;
 using System.Threading.Tasks;
 
@@ -14,6 +15,9 @@ namespace Cognite.Simulator.Extensions
     /// </summary>
     public static class FilesExtensions
     {
+        // Maximum number of simulator sources listed in parallel
+        private const int ListThrottleSize = 5;
+
         /// <summary>
         /// Find all the files in CDF for the given simulator data type (<paramref name="dataType"/>), 
         /// simulator sources (<paramref name="sources"/>) and data sets (optionally).
@@ -143,47 +147,72 @@ namespace Cognite.Simulator.Extensions
             CancellationToken token
             )
         {
-            var result = new List<File>();
-            foreach (var source in sources)
+            // Query the simulator sources concurrently, but with at most `ListThrottleSize` listings
+            // in flight, keeping the results in source order
+            using (var throttler = new SemaphoreSlim(ListThrottleSize))
             {
-                var filterMetadata = new Dictionary<string, string>
-                {
-                    { BaseMetadata.SimulatorKey, source.Key }
-                };
-                filterMetadata.AddRange(metadata);
-                string cursor = null;
-                var filter = new FileFilter
-                {
-                    Source = source.Key,
-                    Uploaded = true,
-                    Metadata = filterMetadata,
-                };
-                if (source.Value.HasValue)
-                {
-                    filter.DataSetIds = new List<Identity> { new Identity(source.Value.Value) };
-                }
-                if (updatedAfter.HasValue)
-                {
-                    filter.LastUpdatedTime = new CogniteSdk.TimeRange
-                    {
-                        Min = updatedAfter.Value.ToUnixTimeMilliseconds() + 1
-                    };
-                }
-                do
+                var sourceFiles = await Task.WhenAll(sources.Select(async source =>
                 {
-                    var fileList = await cdfFiles.ListAsync(new FileQuery
+                    await throttler.WaitAsync(token).ConfigureAwait(false);
+                    try
                     {
-                        Filter = filter,
-                        Cursor = cursor,
-                    }, token).ConfigureAwait(false);
-                    cursor = fileList.NextCursor;
-                    foreach (var file in fileList.Items)
+                        return await FetchSourceFilesFromCdf(cdfFiles, metadata, source, updatedAfter, token)
+                            .ConfigureAwait(false);
+                    }
+                    finally
                     {
-                        result.Add(file);
+                        throttler.Release();
                     }
-                }
-                while (cursor != null);
+                })).ConfigureAwait(false);
+                return sourceFiles.SelectMany(files => files).ToList();
+            }
+        }
+
+        private static async Task<List<File>> FetchSourceFilesFromCdf(
+            FilesResource cdfFiles,
+            Dictionary<string, string> metadata,
+            KeyValuePair<string, long?> source,
+            DateTime? updatedAfter,
+            CancellationToken token
+            )
+        {
+            var result = new List<File>();
+            var filterMetadata = new Dictionary<string, string>
+            {
+                { BaseMetadata.SimulatorKey, source.Key }
+            };
+            filterMetadata.AddRange(metadata);
+            string cursor = null;
+            var filter = new FileFilter
+            {
+                Source = source.Key,
+                Uploaded = true,
+                Metadata = filterMetadata,
+            };
+            if (source.Value.HasValue)
+            {
+                filter.DataSetIds = new List<Identity> { new Identity(source.Value.Value) };
+            }
+            if (updatedAfter.HasValue)
+            {
+                filter.LastUpdatedTime = new CogniteSdk.TimeRange
+                {
+                    Min = updatedAfter.Value.ToUnixTimeMilliseconds() + 1
+                };
+            }
+            do
+            {
+                // Request the largest page allowed by the API to minimize the number of round trips
+                var fileList = await cdfFiles.ListAsync(new FileQuery
+                {
+                    Filter = filter,
+                    Cursor = cursor,
+                    Limit = 1000,
+                }, token).ConfigureAwait(false);
+                cursor = fileList.NextCursor;
+                result.AddRange(fileList.Items);
             }
+            while (cursor != null);
             return result;
         }
     }
@@ -172,12 +172,14 @@ namespace Cognite.Simulator.Extensions
                 return;
             }
 
+            // The heartbeat is the same for all simulators in this update, so it is formatted once
+            var heartbeat = $"{DateTime.UtcNow.ToUnixTimeMilliseconds()}";
             var rowsToCreate = new List<SequenceDataCreate>();
             foreach (var simulator in simulators)
             {
                 var rowData = new Dictionary<string, string>
                 {
-                    { SimulatorIntegrationSequenceRows.Heartbeat, $"{DateTime.UtcNow.ToUnixTimeMilliseconds()}" }
+                    { SimulatorIntegrationSequenceRows.Heartbeat, heartbeat }
                 };
                 if (init)
                 {
@@ -603,7 +605,7 @@ namespace Cognite.Simulator.Extensions
         /// Creates a new exception containing the provided <paramref name="message"/>
         /// </summary>
         /// <param name="message"></param>
-        public SimulationTabularResultsException(string message) : base(message, new List<CogniteError>())
+        public SimulationTabularResultsException(string message) : base(message, Enumerable.Empty<CogniteError>())
         {
         }
     }
@@ -2,7 +2,6 @@
 using Cognite.Extensions;
 using System;
 using System.Collections.Generic;
-using System.Text;
 using System.Threading.Tasks;
 using System.Threading;
 using System.Linq;
@@ -189,7 +188,9 @@ namespace Cognite.Simulator.Extensions
             var tsToCreate = new Dictionary<string, TimeSeriesCreate>();
             foreach (var simTs in simTimeSeries)
             {
-                var tsCreate = GetTimeSeriesCreatePrototype(simTs.TimeSeriesExternalId, dataType, simTs.Calculation, dataSetId);
+                // The external id is derived from the calculation and model names on every access
+                var externalId = simTs.TimeSeriesExternalId;
+                var tsCreate = GetTimeSeriesCreatePrototype(externalId, dataType, simTs.Calculation, dataSetId);
                 tsCreate.Name = simTs.TimeSeriesName;
                 tsCreate.Description = simTs.TimeSeriesDescription;
                 tsCreate.Unit = simTs.Unit;
@@ -200,7 +201,7 @@ namespace Cognite.Simulator.Extensions
                 {
                     tsCreate.Metadata.AddRange(simTs.Metadata);
                 }
-                tsToCreate.Add(simTs.TimeSeriesExternalId, tsCreate);
+                tsToCreate.Add(externalId, tsCreate);
             }
             if (!tsToCreate.Any())
             {
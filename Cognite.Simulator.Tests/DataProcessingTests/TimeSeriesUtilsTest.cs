@@ -37,6 +37,27 @@ public class TimeSeriesUtilsTest
         Assert.Equal(maxTime, _tsTest1.MaxTime);
     }
 
+    [Fact]
+    public void TestRemoveDuplicates()
+    {
+        // Unsorted input with repeated timestamps. Each duplicate has a distinct value, so that
+        // misaligned time and data arrays, or a change in which value is kept, would be detected
+        TimeSeriesData ts = new TimeSeriesData(
+            time: new long[] { 3, 1, 3, 2, 1, 4 }, data: new double[] { 30, 10, 31, 20, 11, 40 }, granularity: 1);
+
+        // Expected results. The value of the first occurrence of each timestamp is kept
+        long[] timeArrayUnique = new long[] { 1, 2, 3, 4 };
+        double[] dataArrayUnique = new double[] { 10, 20, 30, 40 };
+
+        Assert.Equal(timeArrayUnique.Length, ts.Count);
+        Assert.False(ts.HasGaps);
+        for (int i = 0; i < timeArrayUnique.Length; i++)
+        {
+            Assert.Equal(timeArrayUnique[i], ts.Time[i]);
+            Assert.Equal(dataArrayUnique[i], ts.Data[i]);
+        }
+    }
+
     [Fact]
     public void TestTimeSeriesInterpolation1()
     {
@@ -43,6 +43,13 @@ namespace Cognite.Simulator.Tests.ExtensionsTests
             Assert.Throws<ArgumentException>(() => DataPointsExtensions.MinutesToGranularity(144001440));
         }
 
+        [Fact]
+        public void TestAggregateAsStringException()
+        {
+            // An undefined aggregate should be rejected instead of recursing indefinitely
+            Assert.Throws<ArgumentException>(() => ((Extensions.DataPointAggregate)100).AsString());
+        }
+
         [Fact]
         public async Task TestGetSample()
         {
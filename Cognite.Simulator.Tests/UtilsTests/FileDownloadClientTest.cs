@@ -0,0 +1,139 @@
+﻿using Cognite.Simulator.Utils;
+using Microsoft.Extensions.Logging.Abstractions;
+using System;
+using System.IO;
+using System.Net;
+using System.Net.Http;
+using System.Threading;
+using System.Threading.Tasks;
+using Xunit;
+
+namespace Cognite.Simulator.Tests.UtilsTests
+{
+    public class FileDownloadClientTest
+    {
+        [Fact]
+        public async Task TestDownloadFailedStream()
+        {
+            var filePath = Path.Combine(Path.GetTempPath(), $"download-failed-{Guid.NewGuid()}.bin");
+            using var stream = new FailingStream(stall: false);
+            using var handler = new StreamHandler(stream);
+            using var client = new HttpClient(handler, disposeHandler: false);
+            var downloadClient = new FileDownloadClient(client, NullLogger<FileDownloadClient>.Instance);
+
+            // The connection drops after part of the content was received
+            bool downloaded = await downloadClient
+                .DownloadFileAsync(new Uri("http://localhost/file"), filePath)
+                .ConfigureAwait(false);
+
+            Assert.False(downloaded);
+            Assert.False(File.Exists(filePath), "Partially downloaded file should be removed");
+        }
+
+        [Fact]
+        public async Task TestDownloadStalledStream()
+        {
+            var filePath = Path.Combine(Path.GetTempPath(), $"download-stalled-{Guid.NewGuid()}.bin");
+            using var stream = new FailingStream(stall: true);
+            using var handler = new StreamHandler(stream);
+            using var client = new HttpClient(handler, disposeHandler: false)
+            {
+                Timeout = TimeSpan.FromSeconds(1)
+            };
+            var downloadClient = new FileDownloadClient(client, NullLogger<FileDownloadClient>.Instance);
+
+            // The connection stalls after part of the content was received. The download
+            // should be bounded by the client timeout
+            var downloadTask = downloadClient.DownloadFileAsync(new Uri("http://localhost/file"), filePath);
+            var completed = await Task.WhenAny(downloadTask, Task.Delay(TimeSpan.FromSeconds(30))).ConfigureAwait(false);
+
+            Assert.Same(downloadTask, completed);
+            Assert.False(await downloadTask.ConfigureAwait(false));
+            Assert.False(File.Exists(filePath), "Partially downloaded file should be removed");
+        }
+
+        /// <summary>
+        /// Message handler that responds to all requests with the given stream as content
+        /// </summary>
+        private class StreamHandler : HttpMessageHandler
+        {
+            private readonly Stream _content;
+
+            public StreamHandler(Stream content)
+            {
+                _content = content;
+            }
+
+            protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+            {
+                return Task.FromResult(new HttpResponseMessage(HttpStatusCode.OK)
+                {
+                    Content = new StreamContent(_content)
+                });
+            }
+        }
+
+        /// <summary>
+        /// Stream that returns a single chunk of data, then either fails or
+        /// waits until cancelled
+        /// </summary>
+        private class FailingStream : Stream
+        {
+            private readonly bool _stall;
+            private bool _chunkRead;
+
+            public FailingStream(bool stall)
+            {
+                _stall = stall;
+            }
+
+            public override bool CanRead => true;
+            public override bool CanSeek => false;
+            public override bool CanWrite => false;
+            public override long Length => throw new NotSupportedException();
+            public override long Position
+            {
+                get => throw new NotSupportedException();
+                set => throw new NotSupportedException();
+            }
+
+            public override int Read(byte[] buffer, int offset, int count)
+            {
+                return ReadAsync(buffer, offset, count, CancellationToken.None).GetAwaiter().GetResult();
+            }
+
+            public override async Task<int> ReadAsync(byte[] buffer, int offset, int count, CancellationToken cancellationToken)
+            {
+                if (!_chunkRead)
+                {
+                    _chunkRead = true;
+                    int chunk = Math.Min(count, 1024);
+                    Array.Fill(buffer, (byte)1, offset, chunk);
+                    return chunk;
+                }
+                if (_stall)
+                {
+                    await Task.Delay(Timeout.Infinite, cancellationToken).ConfigureAwait(false);
+                }
+                throw new IOException("Connection closed");
+            }
+
+            public override ValueTask<int> ReadAsync(Memory<byte> buffer, CancellationToken cancellationToken = default)
+            {
+                if (!_chunkRead)
+                {
+                    _chunkRead = true;
+                    int chunk = Math.Min(buffer.Length, 1024);
+                    buffer.Span.Slice(0, chunk).Fill(1);
+                    return new ValueTask<int>(chunk);
+                }
+                return new ValueTask<int>(ReadAsync(Array.Empty<byte>(), 0, 0, cancellationToken));
+            }
+
+            public override void Flush() { }
+            public override long Seek(long offset, SeekOrigin origin) => throw new NotSupportedException();
+            public override void SetLength(long value) => throw new NotSupportedException();
+            public override void Write(byte[] buffer, int offset, int count) => throw new NotSupportedException();
+        }
+    }
+}
@@ -4,7 +4,6 @@ using System.Collections.Generic;
 using System.Diagnostics;
 using System.Linq;
 using System.Runtime.InteropServices;
-using System.Text;
 
 namespace Cognite.Simulator.Utils.Automation
 {
@@ -22,6 +21,7 @@ namespace Cognite.Simulator.Utils.Automation
         private readonly ILogger _logger;
         private readonly AutomationConfig _config;
         private IEnumerable<Process> _processes;
+        private Type _serverType;
 
         /// <summary>
         /// Creates an instance of the client that instantiates a connection
@@ -95,7 +95,13 @@ namespace Cognite.Simulator.Utils.Automation
 
         private dynamic ActivateAutomationServer()
         {
-            var serverType = Type.GetTypeFromProgID(_config.ProgramId);
+            // The program id does not change for the lifetime of this client, so the
+            // registry lookup is done once and reused across Initialize/Shutdown cycles
+            if (_serverType == null)
+            {
+                _serverType = Type.GetTypeFromProgID(_config.ProgramId);
+            }
+            var serverType = _serverType;
             if (serverType == null)
             {
                 _logger.LogError("Could not find automation server using the id: {ProgId}", _config.ProgramId);
@@ -1,8 +1,4 @@
-﻿using System;
-using System.Collections.Generic;
-using System.Text;
-
-namespace Cognite.Simulator.Utils
+﻿namespace Cognite.Simulator.Utils
 {
     /// <summary>
     /// Represents a simulator configuration, holding the simulator name and dataset id in CDF.
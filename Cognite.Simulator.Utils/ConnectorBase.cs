@@ -4,7 +4,6 @@ using Microsoft.Extensions.Logging;
 using System;
 using System.Collections.Generic;
 using System.Linq;
-using System.Text;
 using System.Threading;
 using System.Threading.Tasks;
 
@@ -55,11 +54,11 @@ namespace Cognite.Simulator.Utils
         /// <returns>External ID, or null if not found</returns>
         public string GetSimulatorIntegartionExternalId(string simulator)
         {
-            if (!_simulatorSequenceIds.ContainsKey(simulator))
+            if (_simulatorSequenceIds.TryGetValue(simulator, out var externalId))
             {
-                return null;
+                return externalId;
             }
-            return _simulatorSequenceIds[simulator];
+            return null;
         }
 
         /// <summary>
@@ -188,7 +187,7 @@ namespace Cognite.Simulator.Utils
         /// </summary>
         public ConnectorException()
         {
-            Errors = new List<Cognite.Extensions.CogniteError> { };
+            Errors = Enumerable.Empty<Cognite.Extensions.CogniteError>();
         }
 
         /// <summary>
@@ -197,7 +196,7 @@ namespace Cognite.Simulator.Utils
         /// <param name="message">Error message</param>
         public ConnectorException(string message) : base(message)
         {
-            Errors = new List<Cognite.Extensions.CogniteError> { };
+            Errors = Enumerable.Empty<Cognite.Extensions.CogniteError>();
         }
 
         /// <summary>
@@ -218,7 +217,7 @@ namespace Cognite.Simulator.Utils
         /// <param name="innerException">Inner exception</param>
         public ConnectorException(string message, Exception innerException) : base(message, innerException)
         {
-            Errors = new List<Cognite.Extensions.CogniteError> { };
+            Errors = Enumerable.Empty<Cognite.Extensions.CogniteError>();
         }
     }
 }
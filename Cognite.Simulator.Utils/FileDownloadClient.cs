@@ -2,6 +2,7 @@
 using System;
 using System.IO;
 using System.Net.Http;
+using System.Threading;
 using System.Threading.Tasks;
 
 namespace Cognite.Simulator.Utils
@@ -35,32 +36,73 @@ namespace Cognite.Simulator.Utils
         /// <returns><c>true</c> if success, else <c>false</c></returns>
         public async Task<bool> DownloadFileAsync(Uri uri, string filePath)
         {
-            try
+            // The client timeout only covers the wait for the response headers when the content
+            // is streamed, so the same timeout is applied to the whole download explicitly
+            using (var cts = new CancellationTokenSource())
             {
-                var response = await _client.GetAsync(uri)
-                    .ConfigureAwait(false);
-                if (!response.IsSuccessStatusCode)
+                cts.CancelAfter(_client.Timeout);
+                bool fileCreated = false;
+                try
+                {
+                    // Only wait for the headers, so that the content is streamed directly to
+                    // disk instead of being buffered in memory first. Model files can be large
+                    using (var response = await _client.GetAsync(uri, HttpCompletionOption.ResponseHeadersRead, cts.Token)
+                        .ConfigureAwait(false))
+                    {
+                        if (!response.IsSuccessStatusCode)
+                        {
+                            _logger.LogWarning("Failed to download the file: {Message}", response.ReasonPhrase);
+                            return false;
+                        }
+
+                        using (var stream = await response.Content.ReadAsStreamAsync().ConfigureAwait(false))
+                        // FileMode.Create truncates any existing file, so there is no need
+                        // to check for and delete it first
+                        using (var fs = new FileStream(filePath, FileMode.Create))
+                        {
+                            fileCreated = true;
+                            await stream.CopyToAsync(fs, 81920, cts.Token)
+                                .ConfigureAwait(false);
+                            return true;
+                        }
+                    }
+                }
+                catch (HttpRequestException e)
                 {
-                    _logger.LogWarning("Failed to download the file: {Message}", response.ReasonPhrase);
+                    // File cannot be downloaded, skip for now and try again later
+                    _logger.LogError("Failed to download the file: {Message}", e.Message);
                     return false;
                 }
-
-                if (File.Exists(filePath))
+                catch (IOException e)
                 {
-                    File.Delete(filePath);
+                    // The connection can drop while the content is being streamed
+                    _logger.LogError("Failed to download the file: {Message}", e.Message);
+                    DeletePartialFile(filePath, fileCreated);
+                    return false;
                 }
-                using (var fs = new FileStream(filePath, FileMode.CreateNew))
+                catch (OperationCanceledException)
                 {
-                    await response.Content.CopyToAsync(fs)
-                        .ConfigureAwait(false);
-                    return true;
+                    // The download did not complete within the client timeout
+                    _logger.LogError("Failed to download the file: Timed out after {Timeout}", _client.Timeout);
+                    DeletePartialFile(filePath, fileCreated);
+                    return false;
                 }
             }
-            catch (HttpRequestException e)
+        }
+
+        private void DeletePartialFile(string filePath, bool fileCreated)
+        {
+            if (!fileCreated)
+            {
+                return;
+            }
+            try
+            {
+                File.Delete(filePath);
+            }
+            catch (IOException e)
             {
-                // File cannot be downloaded, skip for now and try again later
-                _logger.LogError("Failed to download the file: {Message}", e.Message);
-                return false;
+                _logger.LogWarning("Failed to delete partially downloaded file {Path}: {Message}", filePath, e.Message);
             }
         }
     }
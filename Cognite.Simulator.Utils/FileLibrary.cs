@@ -9,7 +9,6 @@ using System;
 using System.Collections.Generic;
 using System.IO;
 using System.Linq;
-using System.Text;
 using System.Threading;
 using System.Threading.Tasks;
 
@@ -51,13 +50,13 @@ namespace Cognite.Simulator.Utils
 
         // Other injected services
         private readonly FileLibraryConfig _config;
-        private readonly IList<SimulatorConfig> _simulators;
         private readonly IExtractionStateStore _store;
         private readonly FileDownloadClient _downloadClient;
 
         // Internal objects
         private readonly BaseExtractionState _libState;
         private readonly SimulatorDataType _resourceType;
+        private readonly Dictionary<string, long?> _simulatorDataSets;
         private string _modelFolder;
 
         /// <summary>
@@ -81,7 +80,9 @@ namespace Cognite.Simulator.Utils
             IExtractionStateStore store = null)
         {
             _config = config;
-            _simulators = simulators;
+            // The configured simulators do not change while the library runs, so the
+            // (simulator name, data set id) map used when searching for files is built once
+            _simulatorDataSets = simulators?.ToDictionary(s => s.Name, s => (long?)s.DataSetId);
             Cdf = cdf;
             CdfFiles = Cdf.CogniteClient.Files;
             _store = store;
@@ -176,7 +177,7 @@ namespace Cognite.Simulator.Utils
             }
             var files = await CdfFiles.FindSimulatorFiles(
                 _resourceType,
-                _simulators.ToDictionary(s => s.Name, s => (long?)s.DataSetId),
+                _simulatorDataSets,
                 updatedAfter,
                 token).ConfigureAwait(false);
 
@@ -187,17 +188,17 @@ namespace Cognite.Simulator.Utils
                 {
                     continue;
                 }
-                if (!State.ContainsKey(file.ExternalId))
+                if (!State.TryGetValue(file.ExternalId, out var existingState))
                 {
                     // If the file does not exist locally, add it to the state store
                     State.Add(file.ExternalId, fState);
                 }
-                else if (State[fState.Id].UpdatedTime < fState.UpdatedTime)
+                else if (existingState.UpdatedTime < fState.UpdatedTime)
                 {
                     // If the file exists in the state store but was updated in CDF, use the new file instead
                     await _store.RemoveFileStates(
                         _config.FilesTable,
-                        new List<FileState> { State[fState.Id] },
+                        new List<FileState> { existingState },
                         token).ConfigureAwait(false);
                     State[fState.Id] = fState;
                 }
@@ -225,11 +226,15 @@ namespace Cognite.Simulator.Utils
         {
             while (!token.IsCancellationRequested)
             {
-                string timeRange = _libState.DestinationExtractedRange.IsEmpty ? "Empty" : _libState.DestinationExtractedRange.ToString();
-                Logger.LogDebug("Updating file file library. There are currently {Num} files. Extracted range: {TimeRange}",
-                    State.Count,
-                    timeRange
-                    );
+                // Formatting the extracted range is only worth doing if the message is going to be logged
+                if (Logger.IsEnabled(LogLevel.Debug))
+                {
+                    string timeRange = _libState.DestinationExtractedRange.IsEmpty ? "Empty" : _libState.DestinationExtractedRange.ToString();
+                    Logger.LogDebug("Updating file file library. There are currently {Num} files. Extracted range: {TimeRange}",
+                        State.Count,
+                        timeRange
+                        );
+                }
 
                 // Find new model files in CDF and add the to the local state.
                 await FindFiles(true, token)
@@ -254,9 +259,9 @@ namespace Cognite.Simulator.Utils
                         var response = await CdfFiles
                             .DownloadAsync(new[] { new Identity(file.Id) }, token)
                             .ConfigureAwait(false);
-                        if (response.Any() && response.First().DownloadUrl != null)
+                        var uri = response.FirstOrDefault()?.DownloadUrl;
+                        if (uri != null)
                         {
-                            var uri = response.First().DownloadUrl;
                             var filename = Path.Combine(_modelFolder, $"{file.CdfId}.{file.GetExtension()}");
                             bool downloaded = await _downloadClient
                                 .DownloadFileAsync(uri, filename)
@@ -1,8 +1,6 @@
 ﻿using Cognite.Extractor.StateStorage;
 using Cognite.Simulator.Extensions;
 using System;
-using System.Collections.Generic;
-using System.Text;
 
 namespace Cognite.Simulator.Utils
 {